@@ -14,15 +14,29 @@ import aiohttp
 import asyncio
 import json
 import logging
+import random
 import sqlite3
 import time
+from functools import partial
 from math import ceil
-from typing import Dict, List, Optional, Tuple, Union, Any
-from dataclasses import dataclass
-from datetime import datetime
+from operator import attrgetter
+from typing import Awaitable, Callable, Coroutine, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+from dataclasses import dataclass, fields
 from tqdm import tqdm
-from bs4 import BeautifulSoup
-from contextlib import closing
+import lxml.html
+from lxml import etree
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import uvloop  # Optional: faster drop-in replacement for the asyncio event loop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson  # Optional: much faster JSON (de)serialization
+except ImportError:
+    orjson = None
 
 
 # Logger configuration
@@ -32,9 +46,46 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("SCOrgImporter")
+# Set explicitly so that isEnabledFor() checks in hot paths short-circuit without walking the hierarchy
+logger.setLevel(logging.INFO)
+
+# Separator used to build the organizations.content_hash column
+ORG_CONTENT_HASH_SEPARATOR = "\x1f"
+
+# Page size used for newly created databases
+DB_PAGE_SIZE = 8192
+
+# Progress bars refresh at most once per second and are hidden when stderr is not a terminal
+PROGRESS_BAR_OPTIONS = {"mininterval": 1.0, "disable": None}
+
+# organizations columns in Organization field order, for Organization.from_tuple
+ORG_ROW_COLUMNS = ("name, symbol, url_image, url_corpo, archetype, language, "
+                   "commitment, recruitment, role_play, member_count, id")
+
 
+def _json_dumps(obj: Any) -> bytes:
+    """Serializes an object to UTF-8 encoded JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
 
-@dataclass
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Deserializes JSON text, using orjson when available.
+
+    Both backends raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_array(items: List[Any]) -> str:
+    """Serializes a list to a JSON array bound to a "json_each(?)" parameter."""
+    return _json_dumps(items).decode("utf-8")
+
+
+@dataclass(slots=True)
 class Organization:
     """Represents a Star Citizen organization."""
     name: str
@@ -65,25 +116,35 @@ class Organization:
             "nb_membres": self.nb_membres
         }
 
+    def content_hash(self) -> Optional[str]:
+        """Computes the value the organizations.content_hash column holds for this organization.
+
+        Returns:
+            The tracked attributes joined with a unit separator, or None if any is None
+            (mirroring SQL concatenation with NULL).
+        """
+        values = (self.name, self.url_image, self.url_corpo, self.archetype, self.langage,
+                  self.commitment, self.recrutement, self.role_play, self.nb_membres)
+        if any(value is None for value in values):
+            return None
+        return ORG_CONTENT_HASH_SEPARATOR.join(values)
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Organization':
         """Creates an Organization object from a dictionary."""
-        return cls(
-            id=data.get("id"),
-            name=data.get("name"),
-            symbol=data.get("symbol"),
-            url_image=data.get("url_image"),
-            url_corpo=data.get("url_corpo"),
-            archetype=data.get("archetype"),
-            langage=data.get("langage"),
-            commitment=data.get("commitment"),
-            recrutement=data.get("recrutement"),
-            role_play=data.get("role_play"),
-            nb_membres=data.get("nb_membres")
-        )
+        return cls(*map(data.get, _ORGANIZATION_FIELDS))
+
+    @classmethod
+    def from_tuple(cls, row: Tuple) -> 'Organization':
+        """Creates an Organization object from a row selected with ORG_ROW_COLUMNS."""
+        return cls(*row)
 
 
-@dataclass
+# Organization field names in declaration order
+_ORGANIZATION_FIELDS = tuple(f.name for f in fields(Organization))
+
+
+@dataclass(slots=True)
 class Member:
     """Represents a member of a Star Citizen organization."""
     name: str
@@ -105,9 +166,103 @@ class Member:
         }
 
 
+def _with_class(path: str, class_name: str) -> str:
+    """Appends an XPath predicate matching elements whose class list contains `class_name`."""
+    return f"{path}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _parse_html(html: str) -> Optional[etree._Element]:
+    """Parses an HTML fragment with lxml, returning None if it has no content."""
+    try:
+        return lxml.html.fromstring(html)
+    except etree.ParserError:
+        return None
+
+
+# Compiled XPath selectors for the organization listing
+_ORG_CELLS = etree.XPath(_with_class("//div", "org-cell"))
+_ORG_XPATHS = {
+    'thumb': etree.XPath(_with_class(".//span", "thumb")),
+    'url': etree.XPath(".//a[@class='trans-03s clearfix']"),
+    'name': etree.XPath(".//h3[@class='trans-03s name']"),
+    'symbol': etree.XPath(_with_class(".//span", "symbol")),
+    'right': etree.XPath(_with_class(".//span", "right")),
+    'value': etree.XPath(_with_class(".//span", "value")),
+}
+
+# Compiled XPath selectors for organization member cards
+_MEMBER_ITEMS = etree.XPath(_with_class("//li", "member-item"))
+_MEMBER_CARDS = etree.XPath(_with_class("//a", "membercard"))
+_MEMBER_XPATHS = {
+    'card': etree.XPath(_with_class(".//a", "membercard")),
+    'thumb': etree.XPath(_with_class(".//span", "thumb")),
+    'name_wrap': etree.XPath(_with_class(".//span", "name-wrap")),
+    'name': etree.XPath(_with_class(".//span", "name")),
+    'nick': etree.XPath(_with_class(".//span", "nick")),
+    'rank': etree.XPath(_with_class(".//span", "rank")),
+}
+
+
+def _first(elements: List[etree._Element]) -> Optional[etree._Element]:
+    """Returns the first element of an XPath result, or None if it is empty."""
+    return elements[0] if elements else None
+
+
+# Column tuples bound to the organizations / members INSERT statements
+_org_row = attrgetter('name', 'symbol', 'url_image', 'url_corpo', 'archetype',
+                      'langage', 'commitment', 'recrutement', 'role_play', 'nb_membres')
+_member_row = attrgetter('name', 'symbol', 'url_image', 'url_member')
+
+
 class DatabaseManager:
     """Manages database operations."""
 
+    # Connection tuning applied on every connect (WAL lets readers run alongside the writer)
+    CONNECTION_PRAGMAS = (
+        # Only effective on a new database: it must precede the switch to WAL and table creation
+        f"PRAGMA page_size={DB_PAGE_SIZE}",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-131072",  # 128 MB, enough to keep organizations and its indexes cached
+        "PRAGMA mmap_size=4294967296",  # 4 GB
+        "PRAGMA wal_autocheckpoint=10000",  # Pages
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA foreign_keys=ON",
+    )
+
+    # Settings for one-off bulk loads (migration), restored by set_bulk_mode(False)
+    BULK_MODE_PRAGMAS = (
+        "PRAGMA synchronous=OFF",
+        "PRAGMA cache_size=-262144",  # 256 MB
+    )
+    STEADY_MODE_PRAGMAS = (
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA cache_size=-131072",
+    )
+
+    # Member-organization association table. A member may join and leave an organization
+    # several times; only the active association is unique (see idx_mo_active_unique).
+    MEMBER_ORGANIZATION_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS {table} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            member_id INTEGER NOT NULL,
+            organization_id INTEGER NOT NULL,
+            rank TEXT,
+            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            left_at TIMESTAMP,
+            is_active BOOLEAN DEFAULT 1,
+            FOREIGN KEY (member_id) REFERENCES members(id),
+            FOREIGN KEY (organization_id) REFERENCES organizations(id)
+        )"""
+
+    # Concatenation of the tracked organization columns (must match Organization.content_hash)
+    ORG_CONTENT_HASH_SQL = (
+        "name || char(31) || url_image || char(31) || url_corpo || char(31) || archetype || char(31) || "
+        "language || char(31) || commitment || char(31) || recruitment || char(31) || role_play || char(31) || "
+        "member_count"
+    )
+
     def __init__(self, db_path: str = 'sc_organizations.db'):
         """Initializes the database manager.
 
@@ -117,25 +272,199 @@ class DatabaseManager:
         self.db_path = db_path
         self.connection = None
         self.cursor = None
+        self._tuple_cursor = None # Returns plain tuples, for large read-only scans
+
+        # Fixed SQL text for the statements executed on every row; reusing the
+        # same strings lets sqlite3's per-connection cache skip recompilation.
+        self._stmts = {
+            # One JSON array of rows in _org_row order, whatever the batch size
+            'insert_orgs': """
+                INSERT INTO organizations (
+                    name, symbol, url_image, url_corpo, archetype,
+                    language, commitment, recruitment, role_play, member_count
+                )
+                SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+                       json_extract(value, '$[2]'), json_extract(value, '$[3]'),
+                       json_extract(value, '$[4]'), json_extract(value, '$[5]'),
+                       json_extract(value, '$[6]'), json_extract(value, '$[7]'),
+                       json_extract(value, '$[8]'), json_extract(value, '$[9]')
+                FROM json_each(?)
+                RETURNING symbol, id
+            """,
+            'update_org': """
+                UPDATE organizations SET
+                name = ?, url_image = ?, url_corpo = ?, archetype = ?, language = ?,
+                commitment = ?, recruitment = ?, role_play = ?, member_count = ?,
+                last_updated = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """,
+            'touch_orgs': """
+                UPDATE organizations SET last_updated = CURRENT_TIMESTAMP
+                WHERE id IN (SELECT value FROM json_each(?))
+            """,
+            'insert_org_hist': """
+                INSERT INTO organization_history (
+                    organization_id, name, symbol, url_image, url_corpo,
+                    archetype, language, commitment, recruitment, role_play,
+                    member_count, change_description
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            # Batch lookups take a JSON array of symbols so that the SQL text stays
+            # fixed (and cached) whatever the batch size
+            'select_org_hashes': """
+                SELECT id, symbol, content_hash FROM organizations
+                WHERE symbol IN (SELECT value FROM json_each(?))
+            """,
+            'select_org_rows': f"""
+                SELECT {ORG_ROW_COLUMNS} FROM organizations
+                WHERE symbol IN (SELECT value FROM json_each(?))
+            """,
+            'select_member_rows': """
+                SELECT id, symbol, name, url_image, url_member FROM members
+                WHERE symbol IN (SELECT value FROM json_each(?))
+            """,
+            # One JSON array of [name, symbol, url_image, url_member] rows, whatever the batch size
+            'insert_members': """
+                INSERT INTO members (name, symbol, url_image, url_member)
+                SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+                       json_extract(value, '$[2]'), json_extract(value, '$[3]')
+                FROM json_each(?)
+                RETURNING symbol, id
+            """,
+            'update_member': """
+                UPDATE members SET
+                name = ?, url_image = ?, url_member = ?, last_updated = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """,
+        }
 
     def connect(self) -> None:
-        """Establishes a connection to the database."""
-        self.connection = sqlite3.connect(self.db_path)
+        """Establishes a connection to the database.
+
+        The connection runs in autocommit mode (isolation_level=None): write
+        methods join the batch transaction opened with begin() when there is
+        one, and otherwise open and commit their own.
+        """
+        # The importer hands member writes to its writer thread; calls are never concurrent
+        self.connection = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256,
+                                          check_same_thread=False)
+        for pragma in self.CONNECTION_PRAGMAS:
+            self.connection.execute(pragma)
         self.connection.row_factory = sqlite3.Row
         self.cursor = self.connection.cursor()
+        self._tuple_cursor = self.connection.cursor()
+        self._tuple_cursor.row_factory = None
 
     def disconnect(self) -> None:
         """Closes the database connection."""
         if self.connection:
+            try:
+                self.connection.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.warning(f"PRAGMA optimize failed: {e}")
             self.cursor.close()
+            self._tuple_cursor.close()
             self.connection.close()
             self.connection = None
             self.cursor = None
+            self._tuple_cursor = None
+
+    def checkpoint(self, mode: str = "TRUNCATE") -> None:
+        """Checkpoints the WAL into the database file.
+
+        Called after large write batches so the WAL does not keep growing
+        between automatic checkpoints.
+
+        Args:
+            mode: Checkpoint mode, "TRUNCATE" (default) to also reset the WAL
+                file or "PASSIVE" to copy what can be done without waiting.
+        """
+        try:
+            busy, log_pages, checkpointed = self.connection.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+            logger.debug("WAL checkpoint: busy=%d, log pages=%d, checkpointed=%d", busy, log_pages, checkpointed)
+        except sqlite3.Error as e:
+            logger.warning(f"WAL checkpoint failed: {e}")
+
+    def set_bulk_mode(self, enabled: bool) -> None:
+        """Switches the connection between bulk-load and steady-state settings.
+
+        Bulk mode turns off fsync (synchronous=OFF): a crash of the process is
+        still safe under WAL, but a power loss or OS crash may corrupt the
+        database. Only use it for loads that can be re-run from scratch.
+
+        Args:
+            enabled: True to enter bulk mode, False to restore the normal settings.
+        """
+        for pragma in self.BULK_MODE_PRAGMAS if enabled else self.STEADY_MODE_PRAGMAS:
+            self.connection.execute(pragma)
+
+    def begin(self) -> None:
+        """Opens a batch transaction if none is active.
+
+        Write methods called until commit_batch() or rollback_batch() run
+        inside this transaction instead of committing individually.
+        """
+        if not self.connection.in_transaction:
+            self.cursor.execute("BEGIN IMMEDIATE")
+
+    def commit_batch(self) -> None:
+        """Commits the current batch transaction, if any."""
+        if self.connection.in_transaction:
+            self.connection.commit()
+
+    def rollback_batch(self) -> None:
+        """Rolls back the current batch transaction, if any."""
+        if self.connection.in_transaction:
+            self.connection.rollback()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Runs the enclosed writes in one batch transaction.
+
+        Commits when the block exits normally and rolls back if it raises.
+        sqlite3's own "with connection:" cannot be used for this, as it does
+        not issue BEGIN when the connection is in autocommit mode.
+        """
+        self.begin()
+        try:
+            yield
+        except BaseException:
+            self.rollback_batch()
+            raise
+        self.commit_batch()
+
+    @contextmanager
+    def savepoint(self) -> Iterator[None]:
+        """Runs the enclosed writes in a savepoint of the current transaction.
+
+        If the block raises, only its own writes are rolled back and the
+        enclosing batch transaction can still be committed. The original
+        exception is always re-raised, even if SQLite already rolled back the
+        whole transaction (e.g. on SQLITE_FULL or an I/O error).
+        """
+        self.cursor.execute("SAVEPOINT batch_item")
+        try:
+            yield
+        except BaseException:
+            if self.connection.in_transaction:
+                try:
+                    self.cursor.execute("ROLLBACK TO batch_item")
+                    self.cursor.execute("RELEASE batch_item")
+                except sqlite3.Error as e:
+                    logger.error(f"Error rolling back to savepoint: {e}")
+            raise
+        self.cursor.execute("RELEASE batch_item")
 
     def setup_database(self) -> None:
         """Configures the database structure."""
-        # Organizations table
-        self.cursor.execute("""
+        # The page size of an existing WAL database cannot change without a VACUUM outside WAL mode
+        page_size = self.connection.execute("PRAGMA page_size").fetchone()[0]
+        if page_size != DB_PAGE_SIZE:
+            logger.info(f"Database uses a page size of {page_size} bytes (new databases use {DB_PAGE_SIZE})")
+
+        # Tables
+        self.cursor.executescript(f"""
+        -- Organizations table
         CREATE TABLE IF NOT EXISTS organizations (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -152,11 +481,9 @@ class DatabaseManager:
             is_active BOOLEAN DEFAULT 1,
             last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        );
 
-        # Members table
-        self.cursor.execute("""
+        -- Members table
         CREATE TABLE IF NOT EXISTS members (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
@@ -165,11 +492,9 @@ class DatabaseManager:
             url_member TEXT,
             last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
+        );
 
-        # Organization history table
-        self.cursor.execute("""
+        -- Organization history table
         CREATE TABLE IF NOT EXISTS organization_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             organization_id INTEGER NOT NULL,
@@ -186,27 +511,12 @@ class DatabaseManager:
             change_description TEXT,
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (organization_id) REFERENCES organizations(id)
-        )
-        """)
+        );
 
-        # Member-organization association table with history
-        self.cursor.execute("""
-        CREATE TABLE IF NOT EXISTS member_organization (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            member_id INTEGER NOT NULL,
-            organization_id INTEGER NOT NULL,
-            rank TEXT,
-            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            left_at TIMESTAMP,
-            is_active BOOLEAN DEFAULT 1,
-            FOREIGN KEY (member_id) REFERENCES members(id),
-            FOREIGN KEY (organization_id) REFERENCES organizations(id),
-            UNIQUE(member_id, organization_id, is_active)
-        )
-        """)
+        -- Member-organization association table with history
+        {self.MEMBER_ORGANIZATION_TABLE_SQL.format(table="member_organization")};
 
-        # Member rank history table
-        self.cursor.execute("""
+        -- Member rank history table
         CREATE TABLE IF NOT EXISTS member_rank_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             member_id INTEGER NOT NULL,
@@ -215,140 +525,151 @@ class DatabaseManager:
             timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (member_id) REFERENCES members(id),
             FOREIGN KEY (organization_id) REFERENCES organizations(id)
-        )
+        );
         """)
 
-        # Indices for performance improvement
-        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_org_symbol ON organizations (symbol)")
-        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_member_symbol ON members (symbol)")
-        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_member_org ON member_organization (member_id, organization_id)")
+        # Add the generated change-detection column to databases created before it existed
+        self.cursor.execute("PRAGMA table_xinfo(organizations)")
+        if 'content_hash' not in {row['name'] for row in self.cursor.fetchall()}:
+            self.cursor.execute(f"""
+                ALTER TABLE organizations
+                ADD COLUMN content_hash TEXT GENERATED ALWAYS AS ({self.ORG_CONTENT_HASH_SQL}) VIRTUAL
+            """)
+
+        # Databases created with the former UNIQUE(member_id, organization_id, is_active)
+        # constraint are rebuilt without it, since SQLite cannot drop a table constraint
+        self.cursor.execute("PRAGMA index_list(member_organization)")
+        if any(row['origin'] == 'u' for row in self.cursor.fetchall()):
+            logger.info("Rebuilding member_organization without the (member_id, organization_id, is_active) constraint...")
+            self.cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self.cursor.execute(self.MEMBER_ORGANIZATION_TABLE_SQL.format(table="member_organization_new"))
+                self.cursor.execute("""
+                    INSERT INTO member_organization_new (
+                        id, member_id, organization_id, rank, joined_at, left_at, is_active
+                    )
+                    SELECT id, member_id, organization_id, rank, joined_at, left_at, is_active
+                    FROM member_organization
+                """)
+                self.cursor.execute("DROP TABLE member_organization")
+                self.cursor.execute("ALTER TABLE member_organization_new RENAME TO member_organization")
+                self.connection.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Error rebuilding member_organization table: {e}")
+                self.connection.rollback()
+                raise
 
-        self.connection.commit()
+        # Indices for performance improvement
+        self.cursor.executescript("""
+        -- symbol lookups use the UNIQUE constraint's own index
+        DROP INDEX IF EXISTS idx_org_symbol;
+        DROP INDEX IF EXISTS idx_member_symbol;
+        CREATE INDEX IF NOT EXISTS idx_member_org ON member_organization (member_id, organization_id);
+        -- Covering index for the active-members-of-an-organization lookups and departures
+        CREATE INDEX IF NOT EXISTS idx_mo_active ON member_organization (organization_id, is_active, member_id, rank);
+        -- At most one active association per (member, organization) pair; also serves the active pair lookups
+        DROP INDEX IF EXISTS idx_mo_active_pair;
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mo_active_unique ON member_organization (member_id, organization_id) WHERE is_active = 1;
+        CREATE INDEX IF NOT EXISTS idx_org_lastupdated ON organizations (is_active, last_updated);
+        CREATE INDEX IF NOT EXISTS idx_org_members_not_updated ON organizations (id) WHERE members_updated = 0 AND is_active = 1;
+        """)
 
     def migrate_from_old_db(self, old_db_path: str) -> None:
         """Migrates data from the old database structure.
 
+        The old database is attached to the current connection so that each
+        table is copied with a single INSERT ... SELECT inside one transaction.
+        The copy runs in bulk mode (no fsync) since a failed migration is simply
+        run again.
+
         Args:
             old_db_path: Path to the old database.
         """
+        self.cursor.execute("ATTACH DATABASE ? AS old", (old_db_path,))
+        self.set_bulk_mode(True)
         try:
-            old_conn = sqlite3.connect(old_db_path)
-            old_conn.row_factory = sqlite3.Row
-            old_cursor = old_conn.cursor()
-
             # Check if necessary tables exist
-            old_cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='Corporations';")
-            if old_cursor.fetchone() is None:
+            self.cursor.execute("SELECT name FROM old.sqlite_master WHERE type='table' AND name='Corporations'")
+            if self.cursor.fetchone() is None:
                 logger.error("The 'Corporations' table does not exist in the source database.")
                 return
 
+            self.cursor.execute("BEGIN")
+
             # Migrate organizations
             logger.info("Migrating organizations from the old database...")
-            old_cursor.execute("SELECT * FROM Corporations")
-            orgs = old_cursor.fetchall()
-
-            for org in tqdm(orgs, desc="Migrating organizations"):
-                self.cursor.execute("""
-                    INSERT OR IGNORE INTO organizations (
-                        name, symbol, url_image, url_corpo, archetype,
-                        language, commitment, recruitment, role_play, member_count,
-                        members_updated, is_active, last_updated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    org['name'], org['symbol'], org['url_image'], org['url_corpo'],
-                    org['archetype'], org['langage'], org['commitment'],
-                    org['recrutement'], org['role_play'], org['nb_membres'],
-                    bool(org['members_updated']), not bool(org['orga_null']), org['timestamp']
-                ))
+            self.cursor.execute("""
+                INSERT OR IGNORE INTO organizations (
+                    name, symbol, url_image, url_corpo, archetype,
+                    language, commitment, recruitment, role_play, member_count,
+                    members_updated, is_active, last_updated
+                )
+                SELECT name, symbol, url_image, url_corpo, archetype,
+                       langage, commitment, recrutement, role_play, nb_membres,
+                       CASE WHEN members_updated THEN 1 ELSE 0 END,
+                       CASE WHEN orga_null THEN 0 ELSE 1 END,
+                       timestamp
+                FROM old.Corporations
+            """)
+            logger.info(f"Migrated {self.cursor.rowcount} organizations.")
 
-                # Get the organization ID in the new database
-                self.cursor.execute("SELECT id FROM organizations WHERE symbol = ?", (org['symbol'],))
-                result = self.cursor.fetchone()
-
-                if result:
-                    new_org_id = result['id']
-
-                    # Migrate organization history
-                    old_cursor.execute("SELECT * FROM CorporationHistory WHERE corporation_id = ?", (org['id'],))
-                    history_items = old_cursor.fetchall()
-
-                    for item in history_items:
-                        self.cursor.execute("""
-                            INSERT INTO organization_history (
-                                organization_id, name, symbol, url_image, url_corpo,
-                                archetype, language, commitment, recruitment, role_play,
-                                member_count, timestamp
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            new_org_id, item['name'], item['symbol'], item['url_image'],
-                            item['url_corpo'], item['archetype'], item['langage'],
-                            item['commitment'], item['recrutement'], item['role_play'],
-                            item['nb_membres'], item['timestamp']
-                        ))
+            # Migrate organization history
+            self.cursor.execute("""
+                INSERT INTO organization_history (
+                    organization_id, name, symbol, url_image, url_corpo,
+                    archetype, language, commitment, recruitment, role_play,
+                    member_count, timestamp
+                )
+                SELECT o.id, h.name, h.symbol, h.url_image, h.url_corpo,
+                       h.archetype, h.langage, h.commitment, h.recrutement, h.role_play,
+                       h.nb_membres, h.timestamp
+                FROM old.Corporations c
+                JOIN old.CorporationHistory h ON h.corporation_id = c.id
+                JOIN organizations o ON o.symbol = c.symbol
+            """)
+            logger.info(f"Migrated {self.cursor.rowcount} organization history entries.")
 
             # Migrate members
             logger.info("Migrating members from the old database...")
-            old_cursor.execute("SELECT * FROM Members")
-            members = old_cursor.fetchall()
-
-            # Create a mapping table from symbols to IDs
-            symbol_to_id_map = {}
-
-            for member in tqdm(members, desc="Migrating members"):
-                self.cursor.execute("""
-                    INSERT OR IGNORE INTO members (
-                        name, symbol, url_image, url_member, last_updated
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
-                    member['name'], member['symbol'], member['url_image'],
-                    member['url_member'], member['timestamp']
-                ))
-
-                # Get the member ID in the new database
-                self.cursor.execute("SELECT id FROM members WHERE symbol = ?", (member['symbol'],))
-                new_id = self.cursor.fetchone()['id']
-
-                # Store the old ID -> new ID mapping
-                symbol_to_id_map[member['id']] = new_id
+            self.cursor.execute("""
+                INSERT OR IGNORE INTO members (
+                    name, symbol, url_image, url_member, last_updated
+                )
+                SELECT name, symbol, url_image, url_member, timestamp
+                FROM old.Members
+            """)
+            logger.info(f"Migrated {self.cursor.rowcount} members.")
 
             # Migrate member-organization associations
             logger.info("Migrating member-organization associations...")
-            old_cursor.execute("""
-                SELECT DISTINCT mch.id_member, mch.id_corpo, mch.rank, mch.timestamp,
-                               c.symbol as corpo_symbol, m.symbol as member_symbol
-                FROM Memberscorpohistory mch
-                JOIN Members m ON mch.id_member = m.id
-                JOIN Corporations c ON mch.id_corpo = c.id
+            old_associations = """
+                SELECT DISTINCT m.id AS member_id, o.id AS organization_id, mch.rank, mch.timestamp
+                FROM old.Memberscorpohistory mch
+                JOIN old.Members om ON mch.id_member = om.id
+                JOIN old.Corporations oc ON mch.id_corpo = oc.id
+                JOIN members m ON m.symbol = om.symbol
+                JOIN organizations o ON o.symbol = oc.symbol
+            """
+            self.cursor.execute(f"""
+                INSERT OR IGNORE INTO member_organization (
+                    member_id, organization_id, rank, joined_at
+                )
+                SELECT member_id, organization_id, rank, timestamp FROM ({old_associations})
+            """)
+            logger.info(f"Migrated {self.cursor.rowcount} member-organization associations.")
+
+            self.cursor.execute(f"""
+                INSERT INTO member_rank_history (
+                    member_id, organization_id, rank, timestamp
+                )
+                SELECT member_id, organization_id, rank, timestamp FROM ({old_associations})
             """)
-            member_orgs = old_cursor.fetchall()
-
-            for mo in tqdm(member_orgs, desc="Migrating member-organization associations"):
-                # Get IDs in the new database
-                self.cursor.execute("SELECT id FROM members WHERE symbol = ?", (mo['member_symbol'],))
-                member_result = self.cursor.fetchone()
-
-                self.cursor.execute("SELECT id FROM organizations WHERE symbol = ?", (mo['corpo_symbol'],))
-                org_result = self.cursor.fetchone()
-
-                if member_result and org_result:
-                    new_member_id = member_result['id']
-                    new_org_id = org_result['id']
-
-                    # Insert into member_organization
-                    self.cursor.execute("""
-                        INSERT OR IGNORE INTO member_organization (
-                            member_id, organization_id, rank, joined_at
-                        ) VALUES (?, ?, ?, ?)
-                    """, (new_member_id, new_org_id, mo['rank'], mo['timestamp']))
-
-                    # Insert into member_rank_history
-                    self.cursor.execute("""
-                        INSERT INTO member_rank_history (
-                            member_id, organization_id, rank, timestamp
-                        ) VALUES (?, ?, ?, ?)
-                    """, (new_member_id, new_org_id, mo['rank'], mo['timestamp']))
+            logger.info(f"Migrated {self.cursor.rowcount} rank history entries.")
 
             self.connection.commit()
+
+            # Refresh the planner statistics now that the tables are populated
+            self.cursor.execute("ANALYZE main")
             logger.info("Migration completed successfully!")
 
         except sqlite3.Error as e:
@@ -356,251 +677,162 @@ class DatabaseManager:
             self.connection.rollback()
             raise
         finally:
-            if 'old_conn' in locals():
-                old_conn.close()
+            self.set_bulk_mode(False)
+            self.cursor.execute("DETACH DATABASE old")
+
+        # Back under synchronous=NORMAL, the checkpoint syncs the migrated pages to disk
+        self.checkpoint()
 
-    def save_organization(self, org: Organization) -> Tuple[int, bool]:
-        """Saves an organization to the database.
+    def save_organizations(self, orgs: List[Organization]) -> Dict[str, Tuple[int, bool]]:
+        """Saves multiple organizations to the database in a single transaction.
 
         Args:
-            org: The Organization object to save.
+            orgs: List of Organization objects to save.
 
         Returns:
-            Tuple containing the organization ID and a boolean indicating if it's a new entry.
+            Dictionary mapping symbol to a tuple of (organization ID, is new entry).
         """
-        try:
-            self.cursor.execute("SELECT * FROM organizations WHERE symbol = ?", (org.symbol,))
-            existing_org = self.cursor.fetchone()
-
-            is_new = existing_org is None
-            changes = []
-
-            if is_new:
-                # Insert a new organization
-                self.cursor.execute("""
-                    INSERT INTO organizations (
-                        name, symbol, url_image, url_corpo, archetype,
-                        language, commitment, recruitment, role_play, member_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    org.name, org.symbol, org.url_image, org.url_corpo, org.archetype,
-                    org.langage, org.commitment, org.recrutement, org.role_play, org.nb_membres
-                ))
-                org_id = self.cursor.lastrowid
-
-                # Add to history
-                self.cursor.execute("""
-                    INSERT INTO organization_history (
-                        organization_id, name, symbol, url_image, url_corpo,
-                        archetype, language, commitment, recruitment, role_play,
-                        member_count, change_description
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    org_id, org.name, org.symbol, org.url_image, org.url_corpo,
-                    org.archetype, org.langage, org.commitment, org.recrutement,
-                    org.role_play, org.nb_membres, "Organization created"
-                ))
-            else:
-                # Existing organization, check for changes
-                org_id = existing_org['id']
-
-                # Compare attributes to detect changes
-                if org.name != existing_org['name']:
-                    changes.append(f"Name: {existing_org['name']} -> {org.name}")
-
-                if org.url_image != existing_org['url_image']:
-                    changes.append(f"Image URL: {existing_org['url_image']} -> {org.url_image}")
-
-                if org.url_corpo != existing_org['url_corpo']:
-                    changes.append(f"Org URL: {existing_org['url_corpo']} -> {org.url_corpo}")
-
-                if org.archetype != existing_org['archetype']:
-                    changes.append(f"Archetype: {existing_org['archetype']} -> {org.archetype}")
-
-                if org.langage != existing_org['language']:
-                    changes.append(f"Language: {existing_org['language']} -> {org.langage}")
-
-                if org.commitment != existing_org['commitment']:
-                    changes.append(f"Commitment: {existing_org['commitment']} -> {org.commitment}")
-
-                if org.recrutement != existing_org['recruitment']:
-                    changes.append(f"Recruitment: {existing_org['recruitment']} -> {org.recrutement}")
-
-                if org.role_play != existing_org['role_play']:
-                    changes.append(f"Roleplay: {existing_org['role_play']} -> {org.role_play}")
+        # Last occurrence wins if the same symbol appears twice in a batch
+        orgs_by_symbol = {org.symbol: org for org in orgs}
+        if not orgs_by_symbol:
+            return {}
 
-                if org.nb_membres != existing_org['member_count']:
-                    changes.append(f"Member count: {existing_org['member_count']} -> {org.nb_membres}")
+        owns_transaction = not self.connection.in_transaction
+        try:
+            if owns_transaction:
+                self.cursor.execute("BEGIN IMMEDIATE")
+
+            # Fetch the IDs and content hashes for the whole batch at once
+            self.cursor.execute(self._stmts['select_org_hashes'], (_json_array(list(orgs_by_symbol)),))
+            existing_hashes = {row['symbol']: (row['id'], row['content_hash']) for row in self.cursor.fetchall()}
+
+            # Partition the batch into new / changed / unchanged organizations
+            new_orgs = []
+            changed_orgs = [] # List of tuples (Organization, org_id, change description)
+            unchanged_org_ids = []
+            suspect_symbols = [] # Hash differs, the full row is needed to describe the changes
+
+            for symbol, org in orgs_by_symbol.items():
+                existing = existing_hashes.get(symbol)
+                if existing is None:
+                    new_orgs.append(org)
+                    continue
 
-                # If there are changes, update the organization and history
+                org_id, stored_hash = existing
+                if stored_hash is not None and stored_hash == org.content_hash():
+                    unchanged_org_ids.append(org_id)
+                else:
+                    suspect_symbols.append(symbol)
+
+            # Fetch full rows only for the organizations whose hash differs
+            existing_orgs = {}
+            if suspect_symbols:
+                rows = self._tuple_cursor.execute(self._stmts['select_org_rows'], (_json_array(suspect_symbols),))
+                for existing_org in map(Organization.from_tuple, rows):
+                    existing_orgs[existing_org.symbol] = existing_org
+
+            for symbol in suspect_symbols:
+                org = orgs_by_symbol[symbol]
+                existing_org = existing_orgs[symbol]
+                changes = self._describe_organization_changes(org, existing_org)
                 if changes:
                     change_desc = ", ".join(changes)
-                    logger.info(f"Changes detected for {org.symbol}: {change_desc}")
-
-                    # Update the organization
-                    self.cursor.execute("""
-                        UPDATE organizations SET
-                        name = ?, url_image = ?, url_corpo = ?, archetype = ?,
-                        language = ?, commitment = ?, recruitment = ?, role_play = ?,
-                        member_count = ?, last_updated = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        org.name, org.url_image, org.url_corpo, org.archetype,
-                        org.langage, org.commitment, org.recrutement, org.role_play,
-                        org.nb_membres, org_id
-                    ))
-
-                    # Add to history
-                    self.cursor.execute("""
-                        INSERT INTO organization_history (
-                            organization_id, name, symbol, url_image, url_corpo,
-                            archetype, language, commitment, recruitment, role_play,
-                            member_count, change_description
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        org_id, org.name, org.symbol, org.url_image, org.url_corpo,
-                        org.archetype, org.langage, org.commitment, org.recrutement,
-                        org.role_play, org.nb_membres, change_desc
-                    ))
+                    logger.info("Changes detected for %s: %s", org.symbol, change_desc)
+                    changed_orgs.append((org, existing_org.id, change_desc))
                 else:
-                    # No changes, just update the last checked date
-                    self.cursor.execute("""
-                        UPDATE organizations SET last_updated = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (org_id,))
+                    unchanged_org_ids.append(existing_org.id)
 
-            self.connection.commit()
-            return org_id, is_new
+            results = {symbol: (org_id, False) for symbol, (org_id, _) in existing_hashes.items()}
+            history_rows = []
 
-        except sqlite3.Error as e:
-            logger.error(f"Error saving organization {org.symbol}: {e}")
-            self.connection.rollback()
-            raise
+            # Rewrite the full row only for organizations whose attributes changed
+            if changed_orgs:
+                self.cursor.executemany(self._stmts['update_org'], (
+                    (o.name, o.url_image, o.url_corpo, o.archetype, o.langage, o.commitment,
+                     o.recrutement, o.role_play, o.nb_membres, org_id)
+                    for o, org_id, _ in changed_orgs
+                ))
 
-    def save_member(self, member: Member) -> int:
-        """Saves a member to the database.
+            if new_orgs:
+                # One insert returning the new IDs, so no re-select by symbol is needed
+                rows = self._tuple_cursor.execute(
+                    self._stmts['insert_orgs'], (_json_array([_org_row(o) for o in new_orgs]),))
+                results.update({symbol: (org_id, True) for symbol, org_id in rows})
+
+                history_rows.extend(
+                    (results[o.symbol][0], o.name, o.symbol, o.url_image, o.url_corpo,
+                     o.archetype, o.langage, o.commitment, o.recrutement,
+                     o.role_play, o.nb_membres, "Organization created")
+                    for o in new_orgs
+                )
 
-        Args:
-            member: The Member object to save.
+            if changed_orgs:
+                history_rows.extend(
+                    (org_id, o.name, o.symbol, o.url_image, o.url_corpo,
+                     o.archetype, o.langage, o.commitment, o.recrutement,
+                     o.role_play, o.nb_membres, change_desc)
+                    for o, org_id, change_desc in changed_orgs
+                )
 
-        Returns:
-            The member ID.
-        """
-        try:
-            self.cursor.execute("SELECT id FROM members WHERE symbol = ?", (member.symbol,))
-            existing_member = self.cursor.fetchone()
+            # No changes, just update the last checked date (a narrow one-column UPDATE)
+            if unchanged_org_ids:
+                self.cursor.execute(self._stmts['touch_orgs'], (_json_array(unchanged_org_ids),))
 
-            if existing_member:
-                # Update existing member
-                self.cursor.execute("""
-                    UPDATE members SET
-                    name = ?, url_image = ?, url_member = ?, last_updated = CURRENT_TIMESTAMP
-                    WHERE id = ?
-                """, (member.name, member.url_image, member.url_member, existing_member['id']))
-                member_id = existing_member['id']
-            else:
-                # Insert new member
-                self.cursor.execute("""
-                    INSERT INTO members (name, symbol, url_image, url_member)
-                    VALUES (?, ?, ?, ?)
-                """, (member.name, member.symbol, member.url_image, member.url_member))
-                member_id = self.cursor.lastrowid
+            # Add to history
+            if history_rows:
+                self.cursor.executemany(self._stmts['insert_org_hist'], history_rows)
 
-            self.connection.commit()
-            return member_id
+            if owns_transaction:
+                self.connection.commit()
+            return results
 
         except sqlite3.Error as e:
-            logger.error(f"Error saving member {member.symbol}: {e}")
-            self.connection.rollback()
+            logger.error(f"Error saving batch of {len(orgs_by_symbol)} organizations: {e}")
+            if owns_transaction:
+                self.connection.rollback()
             raise
 
-    def save_member_organization(self, member_id: int, org_id: int, rank: str) -> None:
-        """Saves the association between a member and an organization.
+    @staticmethod
+    def _describe_organization_changes(org: Organization, existing_org: Organization) -> List[str]:
+        """Compares a scraped organization against its stored version.
 
         Args:
-            member_id: The member ID.
-            org_id: The organization ID.
-            rank: The member's rank in the organization.
+            org: The scraped Organization object.
+            existing_org: The organization currently stored in the database.
+
+        Returns:
+            List of human-readable change descriptions (empty if nothing changed).
         """
-        try:
-            # Check if the association already exists
-            self.cursor.execute("""
-                SELECT id, rank FROM member_organization
-                WHERE member_id = ? AND organization_id = ? AND is_active = 1
-            """, (member_id, org_id))
-            existing = self.cursor.fetchone()
-
-            if existing:
-                # Check if the rank has changed
-                if existing['rank'] != rank:
-                    logger.info(f"Rank change detected for member {member_id} in organization {org_id}: {existing['rank']} -> {rank}")
-
-                    # Update rank in member_organization
-                    self.cursor.execute("""
-                        UPDATE member_organization SET rank = ?
-                        WHERE id = ?
-                    """, (rank, existing['id']))
-
-                    # Add entry to member_rank_history
-                    self.cursor.execute("""
-                        INSERT INTO member_rank_history (member_id, organization_id, rank)
-                        VALUES (?, ?, ?)
-                    """, (member_id, org_id, rank))
-            else:
-                # New association
-                self.cursor.execute("""
-                    INSERT INTO member_organization (member_id, organization_id, rank)
-                    VALUES (?, ?, ?)
-                """, (member_id, org_id, rank))
+        changes = []
 
-                # Add entry to member_rank_history
-                self.cursor.execute("""
-                    INSERT INTO member_rank_history (member_id, organization_id, rank)
-                    VALUES (?, ?, ?)
-                """, (member_id, org_id, rank))
+        if org.name != existing_org.name:
+            changes.append(f"Name: {existing_org.name} -> {org.name}")
 
-            self.connection.commit()
+        if org.url_image != existing_org.url_image:
+            changes.append(f"Image URL: {existing_org.url_image} -> {org.url_image}")
 
-        except sqlite3.Error as e:
-            logger.error(f"Error saving member-organization association: {e}")
-            self.connection.rollback()
-            raise
+        if org.url_corpo != existing_org.url_corpo:
+            changes.append(f"Org URL: {existing_org.url_corpo} -> {org.url_corpo}")
 
-    def mark_member_left_organization(self, member_id: int, org_id: int) -> None:
-        """Marks that a member has left an organization.
+        if org.archetype != existing_org.archetype:
+            changes.append(f"Archetype: {existing_org.archetype} -> {org.archetype}")
 
-        Args:
-            member_id: The member ID.
-            org_id: The organization ID.
-        """
-        try:
-            # First check if the member is already marked as having left the organization
-            self.cursor.execute("""
-                SELECT id FROM member_organization
-                WHERE member_id = ? AND organization_id = ? AND is_active = 0
-            """, (member_id, org_id))
+        if org.langage != existing_org.langage:
+            changes.append(f"Language: {existing_org.langage} -> {org.langage}")
 
-            if self.cursor.fetchone():
-                # Member is already marked as having left this organization
-                logger.debug(f"Member {member_id} was already marked as having left organization {org_id}")
-                return
+        if org.commitment != existing_org.commitment:
+            changes.append(f"Commitment: {existing_org.commitment} -> {org.commitment}")
 
-            # Update only if an active entry exists
-            result = self.cursor.execute("""
-                UPDATE member_organization SET
-                is_active = 0, left_at = CURRENT_TIMESTAMP
-                WHERE member_id = ? AND organization_id = ? AND is_active = 1
-            """, (member_id, org_id))
+        if org.recrutement != existing_org.recrutement:
+            changes.append(f"Recruitment: {existing_org.recrutement} -> {org.recrutement}")
 
-            if result.rowcount == 0:
-                logger.debug(f"No active entry found for member {member_id} in organization {org_id}")
+        if org.role_play != existing_org.role_play:
+            changes.append(f"Roleplay: {existing_org.role_play} -> {org.role_play}")
 
-            self.connection.commit()
+        if org.nb_membres != existing_org.nb_membres:
+            changes.append(f"Member count: {existing_org.nb_membres} -> {org.nb_membres}")
 
-        except sqlite3.Error as e:
-            logger.error(f"Error marking departure of member {member_id} from organization {org_id}: {e}")
-            self.connection.rollback()
-            # Do not re-raise the exception to avoid interrupting the import
+        return changes
 
     def mark_organization_members_updated(self, org_id: int) -> None:
         """Marks that an organization has had its members updated.
@@ -614,22 +846,19 @@ class DatabaseManager:
                 members_updated = 1
                 WHERE id = ?
             """, (org_id,))
-            self.connection.commit()
 
         except sqlite3.Error as e:
             logger.error(f"Error marking organization {org_id} members as updated: {e}")
-            self.connection.rollback()
             raise
 
     def reset_members_updated_flag(self) -> None:
         """Resets the members_updated flag for all organizations."""
         try:
-            self.cursor.execute("UPDATE organizations SET members_updated = 0")
-            self.connection.commit()
+            # Rows whose flag is already 0 would otherwise be rewritten for nothing
+            self.cursor.execute("UPDATE organizations SET members_updated = 0 WHERE members_updated != 0")
 
         except sqlite3.Error as e:
             logger.error(f"Error resetting members_updated flags: {e}")
-            self.connection.rollback()
             raise
 
     def get_organizations_to_update(self, hours: int = 1) -> List[Dict[str, Any]]:
@@ -642,12 +871,12 @@ class DatabaseManager:
             List of organizations to update.
         """
         try:
-            self.cursor.execute("""
+            rows = self._tuple_cursor.execute("""
                 SELECT id, symbol FROM organizations
                 WHERE last_updated <= datetime('now', ? || ' hours')
                 AND is_active = 1
             """, (f"-{hours}",))
-            return [dict(row) for row in self.cursor.fetchall()]
+            return [{'id': org_id, 'symbol': symbol} for org_id, symbol in rows]
 
         except sqlite3.Error as e:
             logger.error(f"Error retrieving organizations to update: {e}")
@@ -660,255 +889,283 @@ class DatabaseManager:
             List of organizations whose members need to be updated.
         """
         try:
-            self.cursor.execute("""
+            rows = self._tuple_cursor.execute("""
                 SELECT id, symbol FROM organizations
                 WHERE members_updated = 0 AND is_active = 1
                 ORDER BY id ASC
             """)
-            return [dict(row) for row in self.cursor.fetchall()]
+            return [{'id': org_id, 'symbol': symbol} for org_id, symbol in rows]
 
         except sqlite3.Error as e:
             logger.error(f"Error retrieving organizations for member update: {e}")
             raise
 
-    def get_current_members(self, org_id: int) -> Dict[str, int]:
-        """Retrieves the current members of an organization.
-
-        Args:
-            org_id: The organization ID.
-
-        Returns:
-            Dictionary of current members with their IDs.
-        """
-        try:
-            self.cursor.execute("""
-                SELECT m.id, m.symbol
-                FROM members m
-                JOIN member_organization mo ON m.id = mo.member_id
-                WHERE mo.organization_id = ? AND mo.is_active = 1
-            """, (org_id,))
-            return {row['symbol']: row['id'] for row in self.cursor.fetchall()}
-
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving current members of organization {org_id}: {e}")
-            raise
-
-    def get_all_member_symbols(self) -> Dict[str, int]:
-        """Retrieves all member symbols and their IDs from the database.
+    # --- Batch Operations --- #
 
-        Returns:
-            Dictionary mapping member symbol to member ID.
-        """
-        try:
-            self.cursor.execute("SELECT id, symbol FROM members")
-            return {row['symbol']: row['id'] for row in self.cursor.fetchall()}
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving all member symbols: {e}")
-            raise
+    def sync_org_members(self, org_id: int, scraped: List[Tuple[int, str]]) -> None:
+        """Synchronizes an organization's associations with its scraped member list.
 
-    def get_active_org_members_with_rank(self, org_id: int) -> Dict[int, Tuple[str, int]]:
-        """Retrieves active members, their ranks, and association IDs for a specific organization.
+        The scraped list is loaded into a temporary table and the differences
+        (departures, rank changes, new associations and their rank history) are
+        applied with set-based statements. The transaction is committed here
+        unless the caller already opened one, in which case the caller commits.
 
         Args:
             org_id: The organization ID.
-
-        Returns:
-            Dictionary mapping member ID to a tuple of (current rank, association ID).
+            scraped: List of tuples (member_id, rank) currently in the organization.
         """
+        owns_transaction = not self.connection.in_transaction
         try:
+            if owns_transaction:
+                self.cursor.execute("BEGIN IMMEDIATE")
+
+            self.cursor.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS scraped_members (
+                    member_id INTEGER PRIMARY KEY,
+                    rank TEXT
+                )
+            """)
+            self.cursor.execute("DELETE FROM temp.scraped_members")
+            # Unpacked by SQLite from a single JSON parameter; last occurrence wins if a member is listed twice
+            self.cursor.execute("""
+                INSERT OR REPLACE INTO temp.scraped_members (member_id, rank)
+                SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]') FROM json_each(?)
+            """, (_json_array(scraped),))
+
+            # Members no longer listed have left
             self.cursor.execute("""
-                SELECT id, member_id, rank
-                FROM member_organization
+                UPDATE member_organization SET
+                is_active = 0, left_at = CURRENT_TIMESTAMP
                 WHERE organization_id = ? AND is_active = 1
+                AND member_id NOT IN (SELECT member_id FROM temp.scraped_members)
             """, (org_id,))
-            # Map member_id -> (rank, association_id)
-            return {row['member_id']: (row['rank'], row['id']) for row in self.cursor.fetchall()}
-        except sqlite3.Error as e:
-            logger.error(f"Error retrieving active members for organization {org_id}: {e}")
-            raise
-
-    def get_member_name(self, member_id: int) -> str:
-        """Retrieves a member's name from their ID.
+            departures = self.cursor.rowcount
 
-        Args:
-            member_id: The member ID.
+            # Rank history for new associations and rank changes
+            self.cursor.execute("""
+                INSERT INTO member_rank_history (member_id, organization_id, rank)
+                SELECT s.member_id, ?, s.rank
+                FROM temp.scraped_members s
+                LEFT JOIN member_organization mo
+                    ON mo.member_id = s.member_id AND mo.organization_id = ? AND mo.is_active = 1
+                WHERE mo.id IS NULL OR mo.rank IS NOT s.rank
+            """, (org_id, org_id))
+
+            # Rank changes
+            self.cursor.execute("""
+                UPDATE member_organization SET rank = s.rank
+                FROM temp.scraped_members s
+                WHERE member_organization.member_id = s.member_id
+                AND member_organization.organization_id = ?
+                AND member_organization.is_active = 1
+                AND member_organization.rank IS NOT s.rank
+            """, (org_id,))
+            rank_changes = self.cursor.rowcount
 
-        Returns:
-            The member's name or an empty string if not found.
-        """
-        try:
+            # New associations
             self.cursor.execute("""
-                SELECT name, symbol FROM members
-                WHERE id = ?
-            """, (member_id,))
-            result = self.cursor.fetchone()
-            return result['name'] if result else ""
+                INSERT INTO member_organization (member_id, organization_id, rank)
+                SELECT s.member_id, ?, s.rank
+                FROM temp.scraped_members s
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM member_organization mo
+                    WHERE mo.member_id = s.member_id AND mo.organization_id = ? AND mo.is_active = 1
+                )
+            """, (org_id, org_id))
+            new_associations = self.cursor.rowcount
+
+            if owns_transaction:
+                self.connection.commit()
+
+            logger.debug("Synchronized members of organization %s: %d new, %d rank changes, %d departures",
+                         org_id, new_associations, rank_changes, departures)
 
         except sqlite3.Error as e:
-            logger.error(f"Error retrieving name for member {member_id}: {e}")
-            return ""
+            logger.error(f"Error synchronizing members of organization {org_id}: {e}")
+            if owns_transaction:
+                self.connection.rollback()
+            raise
 
-    # --- Batch Operations --- #
+    def upsert_members(self, members: List[Member]) -> Dict[str, int]:
+        """Inserts new members and updates existing ones in a batch.
 
-    def batch_insert_members(self, members_to_insert: List[Member]) -> Dict[str, int]:
-        """Inserts multiple new members in a batch.
+        Existing members are only rewritten when their name or URLs changed.
 
         Args:
-            members_to_insert: List of Member objects to insert.
+            members: List of Member objects to save.
 
         Returns:
-            Dictionary mapping symbol to newly inserted member ID.
+            Dictionary mapping symbol to member ID for every given member.
         """
-        if not members_to_insert:
+        # Last occurrence wins if the same symbol appears twice in a batch
+        members_by_symbol = {m.symbol: m for m in members}
+        if not members_by_symbol:
             return {}
 
-        new_member_ids = {}
         try:
-            data = [
-                (m.name, m.symbol, m.url_image, m.url_member)
-                for m in members_to_insert
-            ]
-            self.cursor.executemany("""
-                INSERT INTO members (name, symbol, url_image, url_member)
-                VALUES (?, ?, ?, ?)
-            """, data)
-
-            # Retrieve IDs for the inserted members (less efficient, but needed)
-            # Assumes symbols are unique and were just inserted
-            symbols = [m.symbol for m in members_to_insert]
-            # Create placeholders for the IN clause
-            placeholders = ', '.join('?' * len(symbols))
-            self.cursor.execute(f"SELECT id, symbol FROM members WHERE symbol IN ({placeholders})", symbols)
-            new_member_ids = {row['symbol']: row['id'] for row in self.cursor.fetchall()}
-            logger.debug(f"Batch inserted {len(data)} new members.")
-            return new_member_ids
+            # Members that already exist: fetch their IDs and stored values
+            member_ids = {}
+            update_data = []
+            self.cursor.execute(self._stmts['select_member_rows'], (_json_array(list(members_by_symbol)),))
+            for row in self.cursor.fetchall():
+                m = members_by_symbol[row['symbol']]
+                member_ids[row['symbol']] = row['id']
+                if (row['name'], row['url_image'], row['url_member']) != (m.name, m.url_image, m.url_member):
+                    update_data.append((m.name, m.url_image, m.url_member, row['id']))
+
+            # Insert only the missing symbols: a conflicting insert would still use up an AUTOINCREMENT value
+            new_members = [m for symbol, m in members_by_symbol.items() if symbol not in member_ids]
+            if new_members:
+                member_ids.update(self._tuple_cursor.execute(
+                    self._stmts['insert_members'], (_json_array([_member_row(m) for m in new_members]),)))
+            if update_data:
+                self.cursor.executemany(self._stmts['update_member'], update_data)
+
+            logger.debug("Batch upserted members: %d new, %d updated, %d unchanged.", len(new_members),
+                         len(update_data), len(members_by_symbol) - len(new_members) - len(update_data))
+            return member_ids
         except sqlite3.Error as e:
-            logger.error(f"Error batch inserting members: {e}")
+            logger.error(f"Error batch upserting members: {e}")
             raise # Re-raise to trigger rollback
 
-    def batch_update_members(self, members_to_update: List[Member]) -> None:
-        """Updates multiple existing members in a batch.
+    # --- End Batch Operations --- #
 
-        Args:
-            members_to_update: List of Member objects with IDs to update.
-        """
-        if not members_to_update:
-            return
 
-        try:
-            data = [
-                (m.name, m.url_image, m.url_member, m.id)
-                for m in members_to_update
-            ]
-            self.cursor.executemany("""
-                UPDATE members SET
-                name = ?, url_image = ?, url_member = ?, last_updated = CURRENT_TIMESTAMP
-                WHERE id = ?
-            """, data)
-            logger.debug(f"Batch updated {len(data)} members.")
-        except sqlite3.Error as e:
-            logger.error(f"Error batch updating members: {e}")
-            raise # Re-raise to trigger rollback
+class RateLimiter:
+    """Token bucket limiting the rate at which API requests are started.
+
+    Up to `burst` requests may start at once, after which requests are spaced
+    to a steady `rate` per second. pause() stops all requests for a while,
+    e.g. when the API reports throttling.
+    """
 
-    def batch_insert_associations(self, associations_to_insert: List[Tuple[int, int, str]]) -> None:
-        """Inserts multiple new member-organization associations.
+    def __init__(self, rate: float, burst: int):
+        """Initializes the rate limiter.
 
         Args:
-            associations_to_insert: List of tuples (member_id, org_id, rank).
+            rate: Sustained number of requests per second.
+            burst: Maximum number of requests that can start back to back.
         """
-        if not associations_to_insert:
-            return
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()  # Waiters are served in arrival order
+
+    async def acquire(self) -> None:
+        """Waits until a request may be started."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
 
-        try:
-            self.cursor.executemany("""
-                INSERT INTO member_organization (member_id, organization_id, rank)
-                VALUES (?, ?, ?)
-            """, associations_to_insert)
-            logger.debug(f"Batch inserted {len(associations_to_insert)} new associations.")
-        except sqlite3.Error as e:
-            # Handle potential UNIQUE constraint violations if logic has overlap
-            if "UNIQUE constraint failed" in str(e):
-                logger.warning(f"Attempted to insert duplicate active associations: {e}")
-            else:
-                logger.error(f"Error batch inserting associations: {e}")
-                raise # Re-raise to trigger rollback
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
 
-    def batch_update_associations_rank(self, associations_to_update: List[Tuple[str, int]]) -> None:
-        """Updates the rank for multiple existing member-organization associations.
+    def pause(self, seconds: float) -> None:
+        """Holds back every request for the given time.
 
         Args:
-            associations_to_update: List of tuples (new_rank, association_id).
+            seconds: Delay before the next request may start.
         """
-        if not associations_to_update:
-            return
-
-        try:
-            self.cursor.executemany("""
-                UPDATE member_organization SET rank = ?
-                WHERE id = ?
-            """, associations_to_update)
-            logger.debug(f"Batch updated rank for {len(associations_to_update)} associations.")
-        except sqlite3.Error as e:
-            logger.error(f"Error batch updating association ranks: {e}")
-            raise # Re-raise to trigger rollback
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # Refill only from the end of the pause, so requests resume at the steady rate
+        self._tokens = 0.0
+        self._updated = self._paused_until
 
-    def batch_insert_rank_history(self, rank_history_to_insert: List[Tuple[int, int, str]]) -> None:
-        """Inserts multiple rank history entries.
 
-        Args:
-            rank_history_to_insert: List of tuples (member_id, org_id, rank).
-        """
-        if not rank_history_to_insert:
-            return
+class RSIApiClient:
+    """Client for interacting with the Roberts Space Industries API."""
 
-        try:
-            self.cursor.executemany("""
-                INSERT INTO member_rank_history (member_id, organization_id, rank)
-                VALUES (?, ?, ?)
-            """, rank_history_to_insert)
-            logger.debug(f"Batch inserted {len(rank_history_to_insert)} rank history entries.")
-        except sqlite3.Error as e:
-            logger.error(f"Error batch inserting rank history: {e}")
-            raise # Re-raise to trigger rollback
+    BASE_URL = "https://robertsspaceindustries.com/api"
 
-    def batch_mark_departures(self, departing_member_ids: List[int], org_id: int) -> None:
-        """Marks multiple members as having left an organization.
+    # Request bodies are pre-serialized JSON bytes
+    REQUEST_HEADERS = {"Content-Type": "application/json"}
+
+    # Maximum number of requests in flight at once (RSI throttles aggressive clients)
+    MAX_CONCURRENT_REQUESTS = 8
+
+    # Sustained request rate, about what the former sequential client with its 0.5 s pause
+    # achieved; up to MAX_CONCURRENT_REQUESTS requests may start in a burst
+    REQUESTS_PER_SECOND = 2.0
+
+    # Constant part of the getOrgs payload (no filters), completed per request
+    ORGS_QUERY_DEFAULTS = {
+        "commitment": [],
+        "roleplay": [],
+        "size": [],
+        "model": [],
+        "activity": [],
+        "language": [],
+        "recruiting": [],
+        "pagesize": 12,
+    }
+
+    def __init__(self, session: aiohttp.ClientSession, requests_per_second: Optional[float] = None,
+                 max_concurrent_requests: Optional[int] = None):
+        """Initializes the API client.
 
         Args:
-            departing_member_ids: List of member IDs that have left.
-            org_id: The organization ID they left.
+            session: aiohttp session to use for requests.
+            requests_per_second: Sustained request rate, REQUESTS_PER_SECOND by default.
+            max_concurrent_requests: Maximum number of requests in flight, MAX_CONCURRENT_REQUESTS by default.
         """
-        if not departing_member_ids:
-            return
+        self.session = session
+        max_concurrent_requests = max_concurrent_requests or self.MAX_CONCURRENT_REQUESTS
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._rate_limiter = RateLimiter(requests_per_second or self.REQUESTS_PER_SECOND,
+                                         max_concurrent_requests)
 
-        try:
-            data = [(org_id, member_id) for member_id in departing_member_ids]
-            result = self.cursor.executemany("""
-                UPDATE member_organization SET
-                is_active = 0, left_at = CURRENT_TIMESTAMP
-                WHERE organization_id = ? AND member_id = ? AND is_active = 1
-            """, data)
-            # Note: executemany doesn't reliably return rowcount in older sqlite versions
-            logger.debug(f"Attempted to mark {len(departing_member_ids)} members as departed from org {org_id}.")
-        except sqlite3.Error as e:
-            logger.error(f"Error batch marking departures for org {org_id}: {e}")
-            raise # Re-raise to trigger rollback
+    @staticmethod
+    def _backoff(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+        """Computes an exponential backoff delay with jitter.
 
-    # --- End Batch Operations --- #
+        Half of the delay is randomized so that requests failing together do
+        not all retry at the same moment.
 
+        Args:
+            attempt: Zero-based attempt number.
+            base: Delay of the first attempt, in seconds.
+            cap: Maximum delay, in seconds.
 
-class RSIApiClient:
-    """Client for interacting with the Roberts Space Industries API."""
+        Returns:
+            Delay in seconds.
+        """
+        delay = min(cap, base * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
 
-    BASE_URL = "https://robertsspaceindustries.com/api"
+    @classmethod
+    def _retry_delay(cls, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Computes how long to wait before retrying a failed request.
 
-    def __init__(self, session: aiohttp.ClientSession):
-        """Initializes the API client.
+        Honors the Retry-After (seconds) and X-RateLimit-Reset (epoch or seconds)
+        headers when the server sends them, otherwise backs off exponentially.
 
         Args:
-            session: aiohttp session to use for requests.
+            response: The failed HTTP response.
+            attempt: Zero-based attempt number.
+
+        Returns:
+            Delay in seconds.
         """
-        self.session = session
+        retry_after = response.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+
+        rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+        if rate_limit_reset and rate_limit_reset.isdigit():
+            reset = float(rate_limit_reset)
+            # Large values are epoch timestamps, small ones a number of seconds
+            return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+        return cls._backoff(attempt)
 
     async def _make_request(self, endpoint: str, data: Dict[str, Any], max_retries: int = 5) -> Optional[Dict[str, Any]]:
         """Makes a request to the RSI API.
@@ -921,44 +1178,51 @@ class RSIApiClient:
         Returns:
             JSON response data or None on failure.
         """
-        headers = {"Content-Type": "application/json"}
-        json_data = json.dumps(data)
+        json_data = _json_dumps(data)
         url = f"{self.BASE_URL}/{endpoint}"
 
+        retry_delay = 0
         for attempt in range(max_retries):
-            try:
-                async with self.session.post(url, data=json_data, headers=headers) as response:
-                    await asyncio.sleep(0.5)  # Respect API limits
+            if retry_delay:
+                # Back off without holding a connection or a concurrency slot
+                await asyncio.sleep(retry_delay)
+            retry_delay = self._backoff(attempt)  # Exponential backoff
 
+            # Respect API limits (waits without holding a concurrency slot)
+            await self._rate_limiter.acquire()
+            try:
+                async with self._semaphore, self.session.post(url, data=json_data, headers=self.REQUEST_HEADERS) as response:
                     if response.status != 200:
                         logger.error(f"HTTP error {response.status} for {url}")
-                        time.sleep(2 ** attempt)  # Exponential backoff
+                        retry_delay = self._retry_delay(response, attempt)  # Exponential backoff or server hint
+                        if response.status == 429:
+                            # Rate limited: slow down every request, not just this one
+                            self._rate_limiter.pause(retry_delay)
                         continue
 
-                    text = await response.text()
-                    if not text:
+                    body = await response.read()
+                    if not body:
                         logger.error("Empty response received from API.")
-                        time.sleep(2 ** attempt)
                         continue
 
                     try:
-                        data = json.loads(text)
+                        data = _json_loads(body)
                     except json.JSONDecodeError as e:
                         logger.error(f"JSON decoding error: {e}")
-                        time.sleep(2 ** attempt)
                         continue
 
                     if data.get('code') == 'ErrApiThrottled':
-                        wait_time = 5 * (2 ** attempt)  # Exponential backoff
-                        logger.warning(f"API throttling detected. Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        retry_delay = self._backoff(attempt, base=5.0)  # Exponential backoff
+                        logger.warning(f"API throttling detected. Retrying in {retry_delay:.1f} seconds...")
+                        self._rate_limiter.pause(retry_delay)
                         continue
 
                     return data
 
             except aiohttp.ClientError as e:
                 logger.error(f"HTTP client error: {e}")
-                time.sleep(2 ** attempt)
+            except asyncio.TimeoutError:
+                logger.error(f"Request to {url} timed out")
 
         logger.error(f"Failed after {max_retries} attempts for {endpoint}")
         return None
@@ -974,19 +1238,7 @@ class RSIApiClient:
         Returns:
             List of retrieved organizations or None on failure.
         """
-        data = {
-            "sort": sort,
-            "search": search,
-            "commitment": [],
-            "roleplay": [],
-            "size": [],
-            "model": [],
-            "activity": [],
-            "language": [],
-            "recruiting": [],
-            "pagesize": 12,
-            "page": page
-        }
+        data = {**self.ORGS_QUERY_DEFAULTS, "sort": sort, "search": search, "page": page}
 
         response = await self._make_request("orgs/getOrgs", data)
         if not response:
@@ -996,8 +1248,22 @@ class RSIApiClient:
             logger.error("Unexpected response format from getOrgs API")
             return None
 
-        soup = BeautifulSoup(response['data']['html'], "lxml")
-        org_cells = soup.find_all("div", {"class": "org-cell"})
+        # Parse in a worker thread so that other requests keep progressing meanwhile
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._parse_organizations_page, response['data']['html'])
+
+    @classmethod
+    def _parse_organizations_page(cls, html: str) -> Optional[List[Organization]]:
+        """Parses an HTML page of organizations.
+
+        Args:
+            html: HTML content to parse.
+
+        Returns:
+            List of organizations extracted from the page, or None if it has none.
+        """
+        root = _parse_html(html)
+        org_cells = _ORG_CELLS(root) if root is not None else []
 
         if not org_cells:
             logger.info("No organizations found on this page")
@@ -1007,31 +1273,27 @@ class RSIApiClient:
 
         for cell in org_cells:
             try:
-                cell_soup = BeautifulSoup(str(cell), "lxml")
-
                 # Image URL
-                img_tag = cell_soup.find("span", {"class": "thumb"}).find("img")
-                url_image = img_tag["src"] if img_tag else ""
+                thumb = _first(_ORG_XPATHS['thumb'](cell))
+                img_tag = thumb.find(".//img") if thumb is not None else None
+                url_image = img_tag.get("src", "") if img_tag is not None else ""
 
                 # Corporation URL
-                url_tag = cell_soup.find("a", {"class": "trans-03s clearfix"})
-                url_corpo = f"https://robertsspaceindustries.com{url_tag['href']}" if url_tag else ""
+                url_tag = _first(_ORG_XPATHS['url'](cell))
+                url_corpo = f"https://robertsspaceindustries.com{url_tag.attrib['href']}" if url_tag is not None else ""
 
                 # Name and symbol
-                name_tag = cell_soup.find("h3", {"class": "trans-03s name"})
-                name = name_tag.text if name_tag else ""
+                name_tag = _first(_ORG_XPATHS['name'](cell))
+                name = name_tag.text_content() if name_tag is not None else ""
 
-                symbol_tag = cell_soup.find("span", {"class": "symbol"})
-                symbol = symbol_tag.text if symbol_tag else ""
+                symbol_tag = _first(_ORG_XPATHS['symbol'](cell))
+                symbol = symbol_tag.text_content() if symbol_tag is not None else ""
 
                 # Other information
-                right_tags = cell_soup.find_all("span", {"class": "right"})
                 info_values = []
 
-                for right_tag in right_tags:
-                    right_soup = BeautifulSoup(str(right_tag), "lxml")
-                    values = right_soup.find_all("span", {"class": "value"})
-                    info_values.extend([v.text for v in values])
+                for right_tag in _ORG_XPATHS['right'](cell):
+                    info_values.extend(v.text_content() for v in _ORG_XPATHS['value'](right_tag))
 
                 archetype = info_values[0] if len(info_values) > 0 else ""
                 langage = info_values[1] if len(info_values) > 1 else ""
@@ -1094,21 +1356,36 @@ class RSIApiClient:
 
         members = await self._parse_members_page(response['data']['html'], symbol) # Pass symbol here
 
-        # Retrieve additional pages
-        for page in range(2, total_pages + 1):
-            data['page'] = page
-            page_response = await self._make_request("orgs/getOrgMembers", data)
+        # Retrieve additional pages concurrently (bounded by the request semaphore)
+        async def fetch_page(page: int) -> List[Member]:
+            page_response = await self._make_request("orgs/getOrgMembers", {**data, "page": page})
 
             if not page_response or 'data' not in page_response or 'html' not in page_response['data']:
                 logger.error(f"Error retrieving page {page} of members for org '{symbol}'") # Added org symbol here too for context
-                continue
+                return []
+
+            return await self._parse_members_page(page_response['data']['html'], symbol) # Pass symbol here too
 
-            page_members = await self._parse_members_page(page_response['data']['html'], symbol) # Pass symbol here too
+        for page_members in await asyncio.gather(*(fetch_page(page) for page in range(2, total_pages + 1))):
             members.extend(page_members)
 
         return (members, total_rows)
 
     async def _parse_members_page(self, html: str, org_symbol: str) -> List[Member]: # Add org_symbol parameter
+        """Parses an HTML page of members in a worker thread.
+
+        Args:
+            html: HTML content to parse.
+            org_symbol: The symbol of the organization being parsed.
+
+        Returns:
+            List of members extracted from the page.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._parse_members_html, html, org_symbol)
+
+    @classmethod
+    def _parse_members_html(cls, html: str, org_symbol: str) -> List[Member]:
         """Parses an HTML page of members.
 
         Args:
@@ -1119,16 +1396,19 @@ class RSIApiClient:
             List of members extracted from the page.
         """
         members = []
-        soup = BeautifulSoup(html, "lxml")
-        member_items = soup.find_all("li", class_="member-item")
+        root = _parse_html(html)
+        if root is None:
+            return members
+
+        member_items = _MEMBER_ITEMS(root)
 
         if not member_items:
-            member_items = soup.find_all("a", class_="membercard")
+            member_items = _MEMBER_CARDS(root)
 
         for item in member_items:
             try:
-                card = item if item.name == 'a' else item.find("a", class_="membercard")
-                if not card:
+                card = item if item.tag == 'a' else _first(_MEMBER_XPATHS['card'](item))
+                if card is None:
                     continue
 
                 # --- Extract URL ---
@@ -1138,23 +1418,24 @@ class RSIApiClient:
                 # --- End Extract URL ---
 
                 # --- Extract Image URL ---
-                img_tag = card.find("span", class_="thumb").find("img") if card.find("span", class_="thumb") else None
-                url_image = img_tag.get('src', '') if img_tag else ""
+                thumb_tag = _first(_MEMBER_XPATHS['thumb'](card))
+                img_tag = thumb_tag.find(".//img") if thumb_tag is not None else None
+                url_image = img_tag.get('src', '') if img_tag is not None else ""
                 if url_image and url_image.startswith('/'):
                     url_image = f"https://robertsspaceindustries.com{url_image}"
                 # --- End Extract Image URL ---
 
-                name_wrap = card.find("span", class_="name-wrap")
-                if not name_wrap:
+                name_wrap = _first(_MEMBER_XPATHS['name_wrap'](card))
+                if name_wrap is None:
                     continue
 
-                name_tag = name_wrap.find("span", class_="name")
-                handle_tag = name_wrap.find("span", class_="nick")
-                rank_tag = card.find("span", class_="rank")
+                name_tag = _first(_MEMBER_XPATHS['name'](name_wrap))
+                handle_tag = _first(_MEMBER_XPATHS['nick'](name_wrap))
+                rank_tag = _first(_MEMBER_XPATHS['rank'](card))
 
-                name = name_tag.text.replace('\u00a0', ' ').strip() if name_tag else "UNKNOWN_NAME"
-                handle = handle_tag.text.replace('\u00a0', ' ').strip() if handle_tag else "UNKNOWN_HANDLE"
-                rank = rank_tag.text.replace('\u00a0', ' ').strip() if rank_tag else "N/A"
+                name = name_tag.text_content().replace('\u00a0', ' ').strip() if name_tag is not None else "UNKNOWN_NAME"
+                handle = handle_tag.text_content().replace('\u00a0', ' ').strip() if handle_tag is not None else "UNKNOWN_HANDLE"
+                rank = rank_tag.text_content().replace('\u00a0', ' ').strip() if rank_tag is not None else "N/A"
 
                 if not name or name.isspace() or not handle or handle.isspace() or handle == "UNKNOWN_HANDLE":
                     continue
@@ -1169,7 +1450,7 @@ class RSIApiClient:
                 members.append(member)
 
             except Exception as e:
-                logger.error(f"Error parsing a member card for org '{org_symbol}': {e}. Card HTML: {item}", exc_info=True) # Added org symbol here too
+                logger.error(f"Error parsing a member card for org '{org_symbol}': {e}. Card HTML: {etree.tostring(item, encoding='unicode')}", exc_info=True) # Added org symbol here too
                 continue # Continue with the next card
 
         return members
@@ -1178,20 +1459,69 @@ class RSIApiClient:
 class OrganizationImporter:
     """Main class for importing Star Citizen organizations."""
 
-    def __init__(self, db_path: str = 'sc_organizations.db'):
+    # Number of organizations saved per transaction when updating existing ones
+    ORG_SAVE_BATCH_SIZE = 100
+
+    # Number of existing organizations whose details are fetched concurrently
+    ORG_UPDATE_CONCURRENCY = 8
+
+    # Number of imported organizations committed together when crawling the listing
+    ORG_COMMIT_BATCH_SIZE = 500
+
+    # Number of organizations whose member lists are fetched concurrently
+    MEMBER_FETCH_CONCURRENCY = 8
+
+    # Maximum number of fetched organizations whose members are saved in one transaction
+    MEMBER_WRITE_BATCH_SIZE = 20
+
+    # Number of organizations saved by the member writer between two WAL checkpoints
+    MEMBER_CHECKPOINT_INTERVAL = 200
+
+    # HTTP connection pool limits shared by all API requests of a cycle (every request
+    # goes to the same host, and RSIApiClient keeps at most MAX_CONCURRENT_REQUESTS in flight)
+    HTTP_CONNECTION_LIMIT = 10
+    HTTP_CONNECTIONS_PER_HOST = 10
+
+    # Per-request timeouts (seconds); a timed-out request is retried by RSIApiClient
+    HTTP_TOTAL_TIMEOUT = 60
+    HTTP_CONNECT_TIMEOUT = 10
+
+    def __init__(self, db_path: str = 'sc_organizations.db', requests_per_second: Optional[float] = None,
+                 max_concurrent_requests: Optional[int] = None):
         """Initializes the importer.
 
         Args:
             db_path: Path to the SQLite database.
+            requests_per_second: Sustained API request rate (RSIApiClient default if None).
+            max_concurrent_requests: Maximum number of API requests in flight (RSIApiClient default if None).
         """
         self.db_path = db_path
         self.db_manager = DatabaseManager(db_path)
+        self.requests_per_second = requests_per_second
+        self.max_concurrent_requests = max_concurrent_requests
+        # Single thread running member writes so that the event loop keeps fetching meanwhile
+        self._db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
 
     async def setup(self) -> None:
         """Configures the importer."""
         self.db_manager.connect()
         self.db_manager.setup_database()
 
+    def _create_api_client(self, session: aiohttp.ClientSession) -> RSIApiClient:
+        """Creates an API client with the importer's rate and concurrency settings.
+
+        run_import_cycle creates one per cycle and passes it to every phase, so
+        that its concurrency cap and rate limit (including throttling pauses)
+        apply to the whole cycle rather than to each phase.
+
+        Args:
+            session: aiohttp session to use for requests.
+
+        Returns:
+            The new API client.
+        """
+        return RSIApiClient(session, self.requests_per_second, self.max_concurrent_requests)
+
     async def migrate_from_old_db(self, old_db_path: str) -> None:
         """Migrates data from the old database.
 
@@ -1201,214 +1531,329 @@ class OrganizationImporter:
         logger.info(f"Migrating from {old_db_path} to {self.db_path}")
         self.db_manager.migrate_from_old_db(old_db_path)
 
-    async def import_organizations(self, session: aiohttp.ClientSession, sort_methods: List[str] = None) -> None:
+    async def import_organizations(self, session: aiohttp.ClientSession, sort_methods: List[str] = None,
+                                   api_client: Optional[RSIApiClient] = None) -> None:
         """Imports organizations from the RSI API.
 
+        Fetched pages are buffered and saved together once ORG_COMMIT_BATCH_SIZE
+        organizations are pending, so no transaction stays open while waiting
+        for the API.
+
         Args:
             session: aiohttp session to use for requests.
             sort_methods: Sorting methods to use for retrieving organizations.
+            api_client: Client shared by the phases of a cycle; a new one is created for `session` if None.
         """
         if sort_methods is None:
             sort_methods = ["created_desc", "created_asc", "size_desc", "size_asc", "active_desc", "active_asc"]
 
-        api_client = RSIApiClient(session)
+        api_client = api_client or self._create_api_client(session)
+        loop = asyncio.get_running_loop()
+        pending_pages = []  # Tuples (page description, organizations) not saved yet
+        pending_count = 0
 
         for sort in sort_methods:
             logger.info(f"Importing organizations with sort: {sort}")
 
-            for page in tqdm(range(1, 401), desc=f"Importing organizations ({sort})"):
+            for page in tqdm(range(1, 401), desc=f"Importing organizations ({sort})", **PROGRESS_BAR_OPTIONS):
                 orgs = await api_client.get_organizations(page=page, sort=sort)
 
                 if not orgs:
                     logger.info(f"No organizations found for page {page} with sort {sort}")
                     break
 
-                for org in orgs:
+                pending_pages.append((f"page {page} ({sort})", orgs))
+                pending_count += len(orgs)
+                if pending_count >= self.ORG_COMMIT_BATCH_SIZE:
+                    await loop.run_in_executor(self._db_writer, self._save_organization_pages, pending_pages)
+                    pending_pages = []
+                    pending_count = 0
+
+        await loop.run_in_executor(self._db_writer, self._save_organization_pages, pending_pages)
+
+    def _save_organization_pages(self, pages: List[Tuple[str, List[Organization]]]) -> None:
+        """Saves fetched pages of organizations in one transaction.
+
+        Each page is saved in its own savepoint: a page that fails is logged
+        and skipped without discarding the other pages.
+
+        Args:
+            pages: List of tuples (page description, organizations).
+        """
+        if not pages:
+            return
+
+        try:
+            with self.db_manager.batch():
+                for description, orgs in pages:
                     try:
-                        self.db_manager.save_organization(org)
+                        with self.db_manager.savepoint():
+                            self.db_manager.save_organizations(orgs)
                     except Exception as e:
-                        logger.error(f"Error saving organization {org.symbol}: {e}")
+                        logger.error(f"Error saving organizations from {description}: {e}")
+        except Exception as e:
+            logger.error(f"Error committing {len(pages)} pages of organizations: {e}")
 
-    async def update_existing_organizations(self, session: aiohttp.ClientSession, hours: int = 1) -> None:
+    async def update_existing_organizations(self, session: aiohttp.ClientSession, hours: int = 1,
+                                            api_client: Optional[RSIApiClient] = None) -> None:
         """Updates existing organizations.
 
+        Up to ORG_UPDATE_CONCURRENCY organizations are fetched at a time while
+        the writer thread saves the results in batches of ORG_SAVE_BATCH_SIZE.
+
         Args:
             session: aiohttp session to use for requests.
             hours: Number of hours since the last update.
+            api_client: Client shared by the phases of a cycle; a new one is created for `session` if None.
         """
-        api_client = RSIApiClient(session)
-        orgs_to_update = self.db_manager.get_organizations_to_update(hours)
+        api_client = api_client or self._create_api_client(session)
+        loop = asyncio.get_running_loop()
+        orgs_to_update = await loop.run_in_executor(self._db_writer, self.db_manager.get_organizations_to_update, hours)
 
         logger.info(f"Updating {len(orgs_to_update)} organizations")
 
-        for org_data in tqdm(orgs_to_update, desc="Updating organizations"):
-            orgs = await api_client.get_organizations(page=1, search=org_data['symbol'])
+        # Bounded so that fetchers wait for the writer instead of piling up results
+        fetched = asyncio.Queue(maxsize=self.ORG_SAVE_BATCH_SIZE)
+
+        async def fetch_organization(org_data: Dict[str, Any]) -> None:
+            try:
+                orgs = await api_client.get_organizations(page=1, search=org_data['symbol'])
+            except Exception as e:
+                logger.error(f"Error fetching organization {org_data['symbol']}: {e}", exc_info=True)
+                orgs = None
+            await fetched.put(orgs[0] if orgs else None)
+
+        async def save_organizations() -> None:
+            pending_orgs = []
+            for _ in tqdm(range(len(orgs_to_update)), desc="Updating organizations", **PROGRESS_BAR_OPTIONS):
+                org = await fetched.get()
+                if org is not None:
+                    pending_orgs.append(org)
+
+                if len(pending_orgs) >= self.ORG_SAVE_BATCH_SIZE:
+                    await loop.run_in_executor(self._db_writer, self._save_organization_batch, pending_orgs)
+                    pending_orgs = []
+
+            await loop.run_in_executor(self._db_writer, self._save_organization_batch, pending_orgs)
+
+        await self._run_with_writer(save_organizations(), fetch_organization, orgs_to_update,
+                                    self.ORG_UPDATE_CONCURRENCY)
+
+    @staticmethod
+    async def _run_with_writer(writer: Coroutine[Any, Any, None], fetch: Callable[[Any], Awaitable[None]],
+                               items: Iterable[Any], concurrency: int) -> None:
+        """Runs a fixed pool of fetchers feeding a bounded queue together with the writer draining it.
 
-            if orgs and len(orgs) > 0:
+        The fetchers pull their items from a shared iterator, so the number of
+        tasks stays at concurrency + 1 whatever the number of items. Stops at
+        the first failure: a dead writer would otherwise leave the fetchers
+        blocked on the full queue forever.
+
+        Args:
+            writer: Coroutine consuming the queue.
+            fetch: Coroutine function fetching one item and filling the queue.
+            items: Items to fetch.
+            concurrency: Number of fetchers.
+        """
+        pending = iter(items)
+
+        async def fetcher() -> None:
+            for item in pending:
+                await fetch(item)
+
+        tasks = [asyncio.create_task(writer), *(asyncio.create_task(fetcher()) for _ in range(concurrency))]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()  # Re-raises the failure, if any
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _save_organization_batch(self, orgs: List[Organization]) -> None:
+        """Saves a batch of updated organizations in one transaction, logging failures.
+
+        The batch is saved with one bulk call; if that fails, it is retried one
+        organization per savepoint so that a bad organization is skipped without
+        discarding the others.
+
+        Args:
+            orgs: List of Organization objects to save.
+        """
+        if not orgs:
+            return
+
+        try:
+            with self.db_manager.batch():
                 try:
-                    self.db_manager.save_organization(orgs[0])
+                    with self.db_manager.savepoint():
+                        self.db_manager.save_organizations(orgs)
                 except Exception as e:
-                    logger.error(f"Error updating organization {org_data['symbol']}: {e}")
+                    logger.warning(f"Error updating {len(orgs)} organizations, retrying one at a time: {e}")
+                    for org in orgs:
+                        try:
+                            with self.db_manager.savepoint():
+                                self.db_manager.save_organizations([org])
+                        except Exception as e:
+                            logger.error(f"Error updating organization {org.symbol}: {e}")
+        except Exception as e:
+            logger.error(f"Error committing {len(orgs)} updated organizations: {e}")
+
+    async def import_members(self, session: aiohttp.ClientSession,
+                             api_client: Optional[RSIApiClient] = None) -> None:
+        """Imports members of organizations using optimized batch processing.
+
+        Member lists are fetched for up to MEMBER_FETCH_CONCURRENCY organizations
+        at a time, while a single writer saves each fetched organization to the
+        database as soon as it is available. The writes run on the writer thread
+        so that they do not block the fetches; organizations fetched while the
+        previous write was running are saved together in one transaction.
 
-    async def import_members(self, session: aiohttp.ClientSession) -> None:
-        """Imports members of organizations using optimized batch processing."""
-        api_client = RSIApiClient(session)
-        orgs_for_members = self.db_manager.get_organizations_for_member_update()
+        Args:
+            session: aiohttp session to use for requests.
+            api_client: Client shared by the phases of a cycle; a new one is created for `session` if None.
+        """
+        api_client = api_client or self._create_api_client(session)
+        loop = asyncio.get_running_loop()
+        orgs_for_members = await loop.run_in_executor(self._db_writer,
+                                                      self.db_manager.get_organizations_for_member_update)
 
         logger.info(f"Optimized member import starting for {len(orgs_for_members)} organizations")
 
-        # Pre-fetch all existing member symbols and IDs once (can consume memory for large member tables)
-        # Consider fetching within the loop if memory becomes an issue
+        # Bounded so that fetchers wait for the writer instead of piling up member lists
+        fetched = asyncio.Queue(maxsize=2 * self.MEMBER_FETCH_CONCURRENCY)
+
+        async def write_members() -> None:
+            saved = 0
+            with tqdm(total=len(orgs_for_members), desc="Importing members (Optimized)",
+                      **PROGRESS_BAR_OPTIONS) as progress:
+                while saved < len(orgs_for_members):
+                    items = [await fetched.get()]
+                    while len(items) < self.MEMBER_WRITE_BATCH_SIZE and not fetched.empty():
+                        items.append(fetched.get_nowait())
+                    await loop.run_in_executor(self._db_writer, self._save_members_batch, items)
+
+                    previous, saved = saved, saved + len(items)
+                    progress.update(len(items))
+                    # Keep the WAL bounded during long member imports
+                    if saved // self.MEMBER_CHECKPOINT_INTERVAL > previous // self.MEMBER_CHECKPOINT_INTERVAL:
+                        await loop.run_in_executor(self._db_writer, self.db_manager.checkpoint, "PASSIVE")
+
+        await self._run_with_writer(write_members(), partial(self._fetch_org_members, api_client, fetched),
+                                    orgs_for_members, self.MEMBER_FETCH_CONCURRENCY)
+
+        logger.info("Finished optimized member import cycle.")
+
+    async def _fetch_org_members(self, api_client: RSIApiClient, fetched: asyncio.Queue,
+                                 org_data: Dict[str, Any]) -> None:
+        """Fetches the members of an organization and queues them for saving.
+
+        Args:
+            api_client: API client used for the requests.
+            fetched: Queue receiving (org_data, result) tuples; result is None on failure.
+            org_data: Dictionary with the organization 'id' and 'symbol'.
+        """
         try:
-            all_member_symbols = self.db_manager.get_all_member_symbols()
-            logger.info(f"Pre-fetched {len(all_member_symbols)} existing member symbols.")
+            result = await api_client.get_organization_members(org_data['symbol'])
         except Exception as e:
-            logger.error(f"Failed to pre-fetch member symbols: {e}. Aborting member import.")
-            return
+            logger.error(f"Error fetching members for {org_data['symbol']}: {e}", exc_info=True)
+            result = None
+        await fetched.put((org_data, result))
+
+    def _save_members_batch(self, items: List[Tuple[Dict[str, Any], Optional[Tuple[List[Member], int]]]]) -> None:
+        """Saves the fetched members of several organizations in one transaction.
+
+        Args:
+            items: List of (org_data, result) tuples, as passed to _save_org_members.
+        """
+        try:
+            with self.db_manager.batch():
+                for org_data, result in items:
+                    self._save_org_members(org_data, result)
+        except Exception as e:
+            symbols = ", ".join(org_data['symbol'] for org_data, _ in items)
+            logger.error(f"Error committing members of organizations {symbols}: {e}")
+
+    def _save_org_members(self, org_data: Dict[str, Any], result: Optional[Tuple[List[Member], int]]) -> None:
+        """Saves the fetched members of an organization.
+
+        The writes run in a savepoint, so a failure only discards this
+        organization's changes from the enclosing transaction.
+
+        Args:
+            org_data: Dictionary with the organization 'id' and 'symbol'.
+            result: Tuple of (members, total) returned by the API, or None on failure.
+        """
+        org_id = org_data['id']
+        org_symbol = org_data['symbol']
+        logger.debug(f"Processing members for {org_symbol} (ID: {org_id})")
 
-        for org_data in tqdm(orgs_for_members, desc="Importing members (Optimized)"):
-            org_id = org_data['id']
-            org_symbol = org_data['symbol']
-            logger.debug(f"Processing members for {org_symbol} (ID: {org_id})")
+        try:
+            if not result:
+                logger.warning(f"Could not retrieve members for {org_symbol} from API. Skipping.")
+                return
 
+            api_members, total = result
+            logger.info(f"Organization {org_symbol}: {len(api_members)}/{total} members retrieved from API")
+
+            # --- Perform Batch DB Operations within a Transaction --- #
             try:
-                # Pre-fetch current active members and ranks for THIS organization
-                active_org_members = self.db_manager.get_active_org_members_with_rank(org_id)
-                logger.debug(f"Pre-fetched {len(active_org_members)} active members for {org_symbol}.")
-
-                # Fetch members from API
-                result = await api_client.get_organization_members(org_symbol)
-                if not result:
-                    logger.warning(f"Could not retrieve members for {org_symbol} from API. Skipping.")
-                    continue
+                with self.db_manager.savepoint():
+                    logger.debug(f"Saving members for {org_symbol}")
 
-                api_members, total = result
-                logger.info(f"Organization {org_symbol}: {len(api_members)}/{total} members retrieved from API")
-
-                # --- Prepare lists for batch operations --- #
-                members_to_insert = [] # List of Member objects
-                members_to_update = [] # List of Member objects with existing ID
-                associations_to_insert = [] # List of tuples (member_id, org_id, rank)
-                associations_to_update = [] # List of tuples (rank, association_id_to_update)
-                rank_history_to_insert = [] # List of tuples (member_id, org_id, rank)
-                retrieved_member_symbols = set()
-                processed_member_ids = set()
-
-                # --- Process members retrieved from API --- #
-                for api_member in api_members:
-                    retrieved_member_symbols.add(api_member.symbol)
-                    member_id = None
-                    is_new_member = False
-
-                    # Check if member exists in our global list
-                    if api_member.symbol in all_member_symbols:
-                        member_id = all_member_symbols[api_member.symbol]
-                        api_member.id = member_id # Assign existing ID
-                        members_to_update.append(api_member)
-                        processed_member_ids.add(member_id)
-                    else:
-                        # Member is new to the database
-                        is_new_member = True
-                        members_to_insert.append(api_member)
-                        # We need the ID after insertion for association, handle this later
-
-                    # Check association and rank (only if member ID is known)
-                    if member_id is not None:
-                        association_data = active_org_members.get(member_id)
-
-                        if association_data is None:
-                            # Member exists but wasn't active in this org -> new association
-                            associations_to_insert.append((member_id, org_id, api_member.rank))
-                            rank_history_to_insert.append((member_id, org_id, api_member.rank))
-                        else:
-                            current_rank, association_id = association_data
-                            if current_rank != api_member.rank:
-                                # Member is active, rank changed
-                                logger.info(f"Rank change for {api_member.symbol} in {org_symbol}: {current_rank} -> {api_member.rank}")
-                                associations_to_update.append((api_member.rank, association_id)) # Use the fetched association_id
-                                rank_history_to_insert.append((member_id, org_id, api_member.rank))
-                            # else: Member active, rank unchanged - do nothing for association/history
-
-                # --- Determine Departures --- #
-                departing_member_ids = []
-                for member_id, (rank, assoc_id) in active_org_members.items(): # Unpack tuple here
-                    if member_id not in processed_member_ids:
-                        departing_member_ids.append(member_id)
-                        # Optionally log departure here
-                        # logger.info(f"Member ID {member_id} left {org_symbol}")
-
-                # --- Perform Batch DB Operations within a Transaction --- #
-                try:
-                    self.db_manager.connection.execute("BEGIN TRANSACTION")
-                    logger.debug(f"Beginning transaction for {org_symbol}")
-
-                    # 1. Batch insert new members
-                    newly_inserted_ids = self.db_manager.batch_insert_members(members_to_insert)
-                    if newly_inserted_ids:
-                        # Update global symbol map
-                        all_member_symbols.update(newly_inserted_ids)
-                        # Prepare associations and history for newly inserted members
-                        for member_obj in members_to_insert:
-                            new_id = newly_inserted_ids.get(member_obj.symbol)
-                            if new_id:
-                                associations_to_insert.append((new_id, org_id, member_obj.rank))
-                                rank_history_to_insert.append((new_id, org_id, member_obj.rank))
-                            else:
-                                logger.warning(f"Could not find newly inserted ID for symbol {member_obj.symbol}")
-
-                    # 2. Batch update existing members
-                    self.db_manager.batch_update_members(members_to_update)
-
-                    # 3. Batch insert new associations (now includes those for new members)
-                    self.db_manager.batch_insert_associations(associations_to_insert)
-
-                    # 4. Batch update existing associations rank
-                    self.db_manager.batch_update_associations_rank(associations_to_update)
-
-                    # 5. Batch insert rank history (now includes those for new members)
-                    self.db_manager.batch_insert_rank_history(rank_history_to_insert)
-
-                    # 6. Batch mark departures
-                    self.db_manager.batch_mark_departures(departing_member_ids, org_id)
-
-                    # 7. Mark organization members as updated
-                    self.db_manager.mark_organization_members_updated(org_id)
+                    # 1. Insert new members and update existing ones, getting back their IDs
+                    member_ids = self.db_manager.upsert_members(api_members)
 
-                    # 8. Commit Transaction
-                    self.db_manager.connection.commit()
-                    logger.debug(f"Committed transaction for {org_symbol}")
+                    # 2. Apply new associations, rank changes and departures in SQL
+                    members_with_ranks = [(member_ids[m.symbol], m.rank) for m in api_members]
+                    self.db_manager.sync_org_members(org_id, members_with_ranks)
 
-                except Exception as db_error:
-                    logger.error(f"Database error during batch processing for {org_symbol}: {db_error}", exc_info=True)
-                    self.db_manager.connection.rollback()
-                    logger.warning(f"Rolled back transaction for {org_symbol}")
-                    # Do not skip the org, just log the error and continue to the next
+                    # 3. Mark organization members as updated
+                    self.db_manager.mark_organization_members_updated(org_id)
 
-                # --- End Batch DB Operations --- #
+                logger.debug(f"Saved members for {org_symbol}")
 
-            except Exception as e:
-                logger.error(f"Error importing members for {org_symbol}: {e}", exc_info=True)
-                # No transaction to rollback here as it's handled in the inner try/except
+            except Exception as db_error:
+                logger.error(f"Database error during batch processing for {org_symbol}: {db_error}", exc_info=True)
+                logger.warning(f"Rolled back changes for {org_symbol}")
+                # Do not skip the org, just log the error and continue to the next
 
-        logger.info("Finished optimized member import cycle.")
+        except Exception as e:
+            logger.error(f"Error importing members for {org_symbol}: {e}", exc_info=True)
+            # No transaction to rollback here as it's handled in the inner try/except
 
     async def run_import_cycle(self) -> None:
         """Runs a full import cycle."""
-        async with aiohttp.ClientSession() as session:
+        connector = aiohttp.TCPConnector(
+            limit=self.HTTP_CONNECTION_LIMIT,
+            limit_per_host=self.HTTP_CONNECTIONS_PER_HOST,
+            keepalive_timeout=60,
+            ttl_dns_cache=600,
+            enable_cleanup_closed=True
+        )
+        timeout = aiohttp.ClientTimeout(total=self.HTTP_TOTAL_TIMEOUT, sock_connect=self.HTTP_CONNECT_TIMEOUT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
             logger.info("Starting import cycle")
+            # One client per cycle: its request limits span every phase and end with the session
+            api_client = self._create_api_client(session)
+            # Database calls go through the writer thread, after any write a failed phase left running
+            loop = asyncio.get_running_loop()
 
             try:
                 # Import organizations with different sort methods
-                await self.import_organizations(session)
+                await self.import_organizations(session, api_client=api_client)
+                await loop.run_in_executor(self._db_writer, self.db_manager.checkpoint)
 
                 # Update existing organizations
-                await self.update_existing_organizations(session)
+                await self.update_existing_organizations(session, api_client=api_client)
+                await loop.run_in_executor(self._db_writer, self.db_manager.checkpoint)
 
                 # Import members
-                await self.import_members(session)
+                await self.import_members(session, api_client=api_client)
 
                 # Reset the member update flag
-                self.db_manager.reset_members_updated_flag()
+                await loop.run_in_executor(self._db_writer, self.db_manager.reset_members_updated_flag)
+                await loop.run_in_executor(self._db_writer, self.db_manager.checkpoint)
 
                 logger.info("Import cycle finished")
 
@@ -1457,5 +1902,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     import os
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     # Run the main coroutine
     asyncio.run(main())
\ No newline at end of file